@@ -0,0 +1,2 @@
+-- CreateIndex
+CREATE INDEX "Article_createdAt_idx" ON "Article"("createdAt");
@@ -0,0 +1,2 @@
+-- CreateIndex
+CREATE INDEX "Comment_articleId_idx" ON "Comment"("articleId");
@@ -0,0 +1,8 @@
+-- DropIndex
+DROP INDEX "Article_authorId_idx";
+
+-- DropIndex
+DROP INDEX "Article_createdAt_idx";
+
+-- CreateIndex
+CREATE INDEX "Article_authorId_createdAt_idx" ON "Article"("authorId", "createdAt");
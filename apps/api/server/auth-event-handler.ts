@@ -13,13 +13,11 @@ export function definePrivateEventHandler<T>(
     return defineEventHandler(async (event) => {
         // you can check request hmac, user, token, etc..
         const header = getHeader(event, 'authorization');
+        const [scheme, credentials] = header ? header.split(' ') : [];
         let token;
 
-        if (
-            (header && header.split(' ')[0] === 'Token') ||
-            (header && header.split(' ')[0] === 'Bearer')
-        ) {
-            token = header.split(' ')[1];
+        if (scheme === 'Token' || scheme === 'Bearer') {
+            token = credentials;
         }
 
         if (options.requireAuth && !token) {
@@ -1,4 +1,3 @@
-export default defineEventHandler(async (event) => {
-    setResponseStatus(event, 200);
-    return "";
+export default defineEventHandler((event) => {
+    return sendNoContent(event, 204);
 });
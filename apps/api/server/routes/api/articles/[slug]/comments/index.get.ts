@@ -38,7 +38,7 @@ export default definePrivateEventHandler(async (event, {auth}) => {
                             username: true,
                             bio: true,
                             image: true,
-                            followedBy: true,
+                            followedBy: useViewerRelation(auth?.id),
                         },
                     },
                 },
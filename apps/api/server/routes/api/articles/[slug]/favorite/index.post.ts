@@ -1,11 +1,10 @@
-import profileMapper from "~/utils/profile.utils";
-import {Tag} from "~/models/tag.model";
+import articleMapper from "~/utils/article.mapper";
 import {definePrivateEventHandler} from "~/auth-event-handler";
 
 export default definePrivateEventHandler(async (event, {auth}) => {
     const slug = getRouterParam(event, "slug");
 
-    const { _count, ...article } = await usePrisma().article.update({
+    const article = await usePrisma().article.update({
         where: {
             slug,
         },
@@ -27,10 +26,10 @@ export default definePrivateEventHandler(async (event, {auth}) => {
                     username: true,
                     bio: true,
                     image: true,
-                    followedBy: true,
+                    followedBy: useViewerRelation(auth.id),
                 },
             },
-            favoritedBy: true,
+            favoritedBy: useViewerRelation(auth.id),
             _count: {
                 select: {
                     favoritedBy: true,
@@ -39,13 +38,5 @@ export default definePrivateEventHandler(async (event, {auth}) => {
         },
     });
 
-    const result = {
-        ...article,
-        author: profileMapper(article.author, auth.id),
-        tagList: article?.tagList.map((tag: Tag) => tag.name),
-        favorited: article.favoritedBy.some((favorited: any) => favorited.id === auth.id),
-        favoritesCount: _count?.favoritedBy,
-    };
-
-    return {article: result};
+    return {article: articleMapper(article, auth.id)};
 });
@@ -33,77 +33,74 @@ const {article} = await readBody(event);
         });
     }
 
-    if (article.title) {
-        newSlug = `${slugify(article.title)}-${auth.id}`;
+    useArticleFields(article, {partial: true});
 
-        if (newSlug !== slug) {
-            const existingTitle = await usePrisma().article.findFirst({
-                where: {
-                    slug: newSlug,
-                },
-                select: {
-                    slug: true,
-                },
-            });
+    if (article.title) {
+        const titleSlug = `${slugify(article.title)}-${auth.id}`;
 
-            if (existingTitle) {
-                throw new HttpException(422, { errors: { title: ['must be unique'] } });
-            }
+        if (titleSlug !== slug) {
+            newSlug = titleSlug;
         }
     }
 
-    const tagList =
-        Array.isArray(article.tagList) && article.tagList?.length
-            ? article.tagList.map((tag: string) => ({
-                create: { name: tag },
-                where: { name: tag },
-            }))
-            : [];
-
-    await disconnectArticlesTags(slug);
+    const tagList = Array.isArray(article.tagList)
+        ? article.tagList.map((tag: string) => ({
+            create: { name: tag },
+            where: { name: tag },
+        }))
+        : null;
 
-    const updatedArticle = await usePrisma().article.update({
-        where: {
-            slug,
-        },
-        data: {
-            ...(article.title ? { title: article.title } : {}),
-            ...(article.body ? { body: article.body } : {}),
-            ...(article.description ? { description: article.description } : {}),
-            ...(newSlug ? { slug: newSlug } : {}),
-            updatedAt: new Date(),
-            tagList: {
-                connectOrCreate: tagList,
+    // Clearing the old tags and applying the update share one transaction, so a
+    // rejected update (e.g. a duplicate slug) leaves the article untouched.
+    const updatedArticle = await usePrisma().$transaction([
+        ...(tagList ? [disconnectArticlesTags(slug)] : []),
+        usePrisma().article.update({
+            where: {
+                slug,
             },
-        },
-        include: {
-            tagList: {
-                select: {
-                    name: true,
-                },
+            data: {
+                ...(article.title ? { title: article.title } : {}),
+                ...(article.body ? { body: article.body } : {}),
+                ...(article.description ? { description: article.description } : {}),
+                ...(newSlug ? { slug: newSlug } : {}),
+                updatedAt: new Date(),
+                ...(tagList ? { tagList: { connectOrCreate: tagList } } : {}),
             },
-            author: {
-                select: {
-                    username: true,
-                    bio: true,
-                    image: true,
-                    followedBy: true,
+            include: {
+                tagList: {
+                    select: {
+                        name: true,
+                    },
                 },
-            },
-            favoritedBy: true,
-            _count: {
-                select: {
-                    favoritedBy: true,
+                author: {
+                    select: {
+                        username: true,
+                        bio: true,
+                        image: true,
+                        followedBy: useViewerRelation(auth.id),
+                    },
+                },
+                favoritedBy: useViewerRelation(auth.id),
+                _count: {
+                    select: {
+                        favoritedBy: true,
+                    },
                 },
             },
-        },
+        }),
+    ]).then((results: any[]) => results.pop()).catch((error: unknown) => {
+        if (isUniqueConstraintError(error, 'slug')) {
+            throw new HttpException(422, { errors: { title: ['must be unique'] } });
+        }
+
+        throw error;
     });
 
     return {article: articleMapper(updatedArticle, auth.id)};
 });
 
-const disconnectArticlesTags = async (slug: string) => {
-    await usePrisma().article.update({
+const disconnectArticlesTags = (slug: string) =>
+    usePrisma().article.update({
         where: {
             slug,
         },
@@ -113,4 +110,3 @@ const disconnectArticlesTags = async (slug: string) => {
             },
         },
     });
-};
@@ -5,46 +5,46 @@ export default definePrivateEventHandler(async (event, {auth}) => {
     const query = getQuery(event);
 
     const andQueries = buildFindAllQuery(query, auth);
-    const articlesCount = await usePrisma().article.count({
-        where: {
-            AND: andQueries,
-        },
-    });
-
-    const articles = await usePrisma().article.findMany({
-        omit: {
-            body: true,
-        },
-        where: { AND: andQueries },
-        orderBy: {
-            createdAt: 'desc',
-        },
-        skip: Number(query.offset) || 0,
-        take: Number(query.limit) || 10,
-        include: {
-            tagList: {
-                orderBy: {
-                    name: 'asc',
-                },
-                select: {
-                    name: true,
-                },
+    const [articlesCount, articles] = await usePrisma().$transaction([
+        usePrisma().article.count({
+            where: {
+                AND: andQueries,
             },
-            author: {
-                select: {
-                    username: true,
-                    image: true,
-                    followedBy: true,
-                },
+        }),
+        usePrisma().article.findMany({
+            omit: {
+                body: true,
             },
-            favoritedBy: true,
-            _count: {
-                select: {
-                    favoritedBy: true,
+            where: { AND: andQueries },
+            orderBy: {
+                createdAt: 'desc',
+            },
+            ...usePagination(query),
+            include: {
+                tagList: {
+                    orderBy: {
+                        name: 'asc',
+                    },
+                    select: {
+                        name: true,
+                    },
+                },
+                author: {
+                    select: {
+                        username: true,
+                        image: true,
+                        followedBy: useViewerRelation(auth?.id),
+                    },
+                },
+                favoritedBy: useViewerRelation(auth?.id),
+                _count: {
+                    select: {
+                        favoritedBy: true,
+                    },
                 },
             },
-        },
-    });
+        }),
+    ]);
 
     return {
         articles: articles.map((article: any) => articleMapper(article, auth.id)),
@@ -9,33 +9,10 @@ export default definePrivateEventHandler(async (event, {auth}) => {
     const { title, description, body, tagList } = article;
     const tags = Array.isArray(tagList) ? tagList : [];
 
-    if (!title) {
-        throw new HttpException(422, { errors: { title: ["can't be blank"] } });
-    }
-
-    if (!description) {
-        throw new HttpException(422, { errors: { description: ["can't be blank"] } });
-    }
-
-    if (!body) {
-        throw new HttpException(422, { errors: { body: ["can't be blank"] } });
-    }
+    useArticleFields(article);
 
     const slug = `${slugify(title)}-${auth.id}`;
 
-    const existingTitle = await usePrisma().article.findUnique({
-        where: {
-            slug,
-        },
-        select: {
-            slug: true,
-        },
-    });
-
-    if (existingTitle) {
-        throw new HttpException(422, { errors: { title: ['must be unique'] } });
-    }
-
     const {
         authorId,
         id: articleId,
@@ -69,16 +46,22 @@ export default definePrivateEventHandler(async (event, {auth}) => {
                     username: true,
                     bio: true,
                     image: true,
-                    followedBy: true,
+                    followedBy: useViewerRelation(auth.id),
                 },
             },
-            favoritedBy: true,
+            favoritedBy: useViewerRelation(auth.id),
             _count: {
                 select: {
                     favoritedBy: true,
                 },
             },
         },
+    }).catch((error: unknown) => {
+        if (isUniqueConstraintError(error, 'slug')) {
+            throw new HttpException(422, { errors: { title: ['must be unique'] } });
+        }
+
+        throw error;
     });
 
     return {article: articleMapper(createdArticle, auth.id)};
@@ -16,7 +16,7 @@ const username = getRouterParam(event, 'username');
             },
         },
         include: {
-            followedBy: true,
+            followedBy: useViewerRelation(auth.id),
         },
     });
 
@@ -10,7 +10,7 @@ export default definePrivateEventHandler(async (event, {auth}) => {
             username,
         },
         include: {
-            followedBy: true,
+            followedBy: useViewerRelation(auth?.id),
         },
     });
 
@@ -2,23 +2,20 @@ import {Tag} from "~/models/tag.model";
 import {definePrivateEventHandler} from "~/auth-event-handler";
 
 export default definePrivateEventHandler(async (event, {auth}) => {
-    const queries = [];
-    queries.push({demo: true});
-
-    if (auth) {
-        queries.push({
-            id: {
-                equals: auth.id,
-            },
-        });
+    if (!auth) {
+        return {tags: await findDemoTags()};
     }
 
+    return {tags: await findTags([{demo: true}, {id: {equals: auth.id}}])};
+}, {requireAuth: false});
+
+const findTags = async (authorQueries: any[]) => {
     const tags = await usePrisma().tag.findMany({
         where: {
             articles: {
                 some: {
                     author: {
-                        OR: queries,
+                        OR: authorQueries,
                     },
                 },
             },
@@ -34,5 +31,11 @@ export default definePrivateEventHandler(async (event, {auth}) => {
         take: 10,
     });
 
-    return {tags: tags.map((tag: Tag) => tag.name)};
-}, {requireAuth: false});
+    return tags.map((tag: Tag) => tag.name);
+};
+
+// Anonymous visitors all see the same demo tags, so share one result between them.
+const findDemoTags = defineCachedFunction(() => findTags([{demo: true}]), {
+    name: 'demo-tags',
+    maxAge: 60,
+});
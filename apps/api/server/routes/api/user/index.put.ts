@@ -4,6 +4,8 @@ import {definePrivateEventHandler} from "~/auth-event-handler";
 export default definePrivateEventHandler(async (event, {auth}) => {
     const {user} = await readBody(event);
 
+    useStringFields(user, ['email', 'username', 'password', 'image', 'bio']);
+
     const {email, username, password, image, bio} = user;
     let hashedPassword;
 
@@ -4,6 +4,8 @@ import {default as bcrypt} from 'bcryptjs';
 export default defineEventHandler(async (event) => {
     const {user} = await readBody(event);
 
+    useStringFields(user, ['email', 'username', 'password', 'image', 'bio']);
+
     const email = user.email?.trim();
     const username = user.username?.trim();
     const password = user.password?.trim();
@@ -21,6 +23,10 @@ export default defineEventHandler(async (event) => {
         throw new HttpException(422, {errors: {password: ["can't be blank"]}});
     }
 
+    if (demo != null && typeof demo !== 'boolean') {
+        throw new HttpException(422, {errors: {demo: ['must be a boolean']}});
+    }
+
     await checkUserUniqueness(email, username);
 
     const hashedPassword = await bcrypt.hash(password, 10);
@@ -52,29 +58,27 @@ export default defineEventHandler(async (event) => {
 });
 
 const checkUserUniqueness = async (email: string, username: string) => {
-    const existingUserByEmail = await usePrisma().user.findUnique({
+    const existingUsers = await usePrisma().user.findMany({
         where: {
-            email,
+            OR: [
+                {email},
+                {username},
+            ],
         },
         select: {
-            id: true,
+            email: true,
+            username: true,
         },
     });
 
-    const existingUserByUsername = await usePrisma().user.findUnique({
-        where: {
-            username,
-        },
-        select: {
-            id: true,
-        },
-    });
+    const emailTaken = existingUsers.some((existingUser: any) => existingUser.email === email);
+    const usernameTaken = existingUsers.some((existingUser: any) => existingUser.username === username);
 
-    if (existingUserByEmail || existingUserByUsername) {
+    if (emailTaken || usernameTaken) {
         throw new HttpException(422, {
             errors: {
-                ...(existingUserByEmail ? {email: ['has already been taken']} : {}),
-                ...(existingUserByUsername ? {username: ['has already been taken']} : {}),
+                ...(emailTaken ? {email: ['has already been taken']} : {}),
+                ...(usernameTaken ? {username: ['has already been taken']} : {}),
             },
         });
     }
@@ -3,13 +3,11 @@ import {default as jwt} from "jsonwebtoken";
 export const useCheckAuth = (mode: 'optional' | 'required') => (event) => {
     // const token = getCookie(event, 'auth_token');
     const header = getHeader(event, 'authorization');
+    const [scheme, credentials] = header ? header.split(' ') : [];
     let token;
 
-    if (
-        (header && header.split(' ')[0] === 'Token') ||
-        (header && header.split(' ')[0] === 'Bearer')
-    ) {
-        token = header.split(' ')[1];
+    if (scheme === 'Token' || scheme === 'Bearer') {
+        token = credentials;
     }
 
     if (!token && mode === 'required') {
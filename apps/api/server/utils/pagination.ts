@@ -0,0 +1,12 @@
+const DEFAULT_LIMIT = 10;
+const MAX_LIMIT = 100;
+
+export const usePagination = (query: Record<string, any>) => {
+    const limit = Number.parseInt(query.limit, 10);
+    const offset = Number.parseInt(query.offset, 10);
+
+    return {
+        skip: offset > 0 ? offset : 0,
+        take: limit > 0 ? Math.min(limit, MAX_LIMIT) : DEFAULT_LIMIT,
+    };
+};
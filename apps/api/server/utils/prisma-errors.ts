@@ -0,0 +1,7 @@
+import { Prisma } from '@prisma/client';
+
+// `meta.target` is the list of fields or the index name, depending on the connector.
+export const isUniqueConstraintError = (error: unknown, field: string): boolean =>
+    error instanceof Prisma.PrismaClientKnownRequestError &&
+    error.code === 'P2002' &&
+    String(error.meta?.target).includes(field);
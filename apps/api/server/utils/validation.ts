@@ -0,0 +1,31 @@
+import HttpException from "~/models/http-exception.model";
+
+// Rejects fields that are present but not strings before they reach slugify, bcrypt or Prisma.
+export const useStringFields = (data: any, fields: string[]) => {
+    for (const field of fields) {
+        if (data[field] != null && typeof data[field] !== 'string') {
+            throw new HttpException(422, {errors: {[field]: ['must be a string']}});
+        }
+    }
+};
+
+// On update, missing, null or empty fields are left unchanged, so only the others are checked.
+export const useArticleFields = (article: any, options: { partial: boolean } = {partial: false}) => {
+    for (const field of ['title', 'description', 'body']) {
+        if (options.partial && !article[field]) {
+            continue;
+        }
+
+        if (!article[field]) {
+            throw new HttpException(422, {errors: {[field]: ["can't be blank"]}});
+        }
+
+        if (typeof article[field] !== 'string') {
+            throw new HttpException(422, {errors: {[field]: ['must be a string']}});
+        }
+    }
+
+    if (Array.isArray(article.tagList) && article.tagList.some((tag: unknown) => typeof tag !== 'string')) {
+        throw new HttpException(422, {errors: {tagList: ['must be a list of strings']}});
+    }
+};
@@ -0,0 +1,11 @@
+// Narrows a User relation (followers, favorites) down to the current viewer,
+// so `following`/`favorited` checks load at most one row instead of all of them.
+// Ids start at 1, so anonymous requests match nothing.
+export const useViewerRelation = (id?: number) => ({
+    where: {
+        id: id ?? 0,
+    },
+    select: {
+        id: true,
+    },
+});